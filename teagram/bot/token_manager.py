@@ -1,6 +1,5 @@
 import logging
 import asyncio
-import time
 import sys
 import re
 from typing import Union
@@ -13,6 +12,10 @@ from .types import Item
 
 logger = logging.getLogger()
 
+_TOKEN_EXTRACT_RE = re.compile(r"<code>(.+?)</code>|(\d+:[0-9a-zA-Z_-]{35})")
+_TOKEN_RE = re.compile(r"\d{1,}:[0-9a-zA-Z_-]{35}")
+_BOTNAME_RE = re.compile(r"@teagram_[0-9a-zA-Z]{6}_bot")
+
 
 class TokenManager(Item):
     """
@@ -44,7 +47,7 @@ class TokenManager(Item):
                 phrase in response.text for phrase in ["That I cannot do.", "Sorry"]
             ):
                 if "too many attempts" in response.text:
-                    seconds = response.text.split()[-2]
+                    seconds = response.text.rsplit(maxsplit=2)[-2]
                     logger.error(f"Please try again after {seconds} seconds")
                 elif "20 bots" in response.text:
                     logger.error(
@@ -67,19 +70,16 @@ class TokenManager(Item):
 
             await conv.send_message(bot_username)
 
-            time.sleep(0.5)
+            await asyncio.sleep(0.5)
             response = await conv.get_response()
 
-            search = re.search(r"(?<=<code>)(.*?)(?=</code>)", response.text)
-            if not search and not (
-                search := re.search(r"\d{1,}:[0-9a-zA-Z_-]{35}", response.text)
-            ):
+            if not (search := _TOKEN_EXTRACT_RE.search(response.text)):
                 logger.error(
                     "An error occurred while creating the bot. @BotFather's response:"
                 )
                 return logger.error(response.text)
 
-            token = search.group(0)
+            token = search.group(1) or search.group(2)
 
             await conv.send_message("/setuserpic")
             await conv.get_response()
@@ -101,8 +101,6 @@ class TokenManager(Item):
                 await conv.send_message(message)
                 await conv.get_response()
 
-                await asyncio.sleep(1)
-
             logger.info("Bot created successfully")
             return token
 
@@ -129,7 +127,7 @@ class TokenManager(Item):
 
             if not response.reply_markup:
                 logger.warning("reply_markup not found")
-                time.sleep(1.5)
+                await asyncio.sleep(1.5)
                 response = await conv.get_response()
 
             if not getattr(response.reply_markup, "rows", None):
@@ -139,7 +137,7 @@ class TokenManager(Item):
             found = False
             for row in response.reply_markup.rows:
                 for button in row.buttons:
-                    if search := re.search(r"@teagram_[0-9a-zA-Z]{6}_bot", button.text):
+                    if search := _BOTNAME_RE.search(button.text):
                         self.bot_username = button.text
 
                         await conv.send_message(button.text)
@@ -151,9 +149,9 @@ class TokenManager(Item):
                 else:
                     return False
 
-            time.sleep(1)
+            await asyncio.sleep(1)
             response = await conv.get_response()
-            if search := re.search(r"\d{1,}:[0-9a-zA-Z_-]{35}", response.text):
+            if search := _TOKEN_RE.search(response.text):
                 return str(search.group(0))
-            token = response.text.split()[-1]
+            token = response.text.rsplit(maxsplit=1)[-1]
             return str(token)
@@ -423,7 +423,7 @@ class ModulesManager:
         await self.send_on_loads()
         for custom_module in self._db.get(__name__, "modules", []):
             try:
-                r = await utils.run_sync(requests.get, custom_module)
+                r = await utils.run_sync(utils.get_session().get, custom_module)
                 await self.load_module(r.text, r.url)
             except requests.exceptions.RequestException as error:
                 logger.exception(
@@ -11,6 +11,7 @@
 
 from . import auth, database, loader, web, utils, __version__
 
+from telethon import errors
 from telethon.tl.functions.channels import InviteToChannelRequest, EditAdminRequest
 from telethon.tl.functions.messages import StartBotRequest
 from telethon.types import ChatAdminRights
@@ -168,12 +169,11 @@ class Main:
 
             try:
                 _id = list(map(int, restart["msg"].split(":")))
-                msg = await app.get_messages(_id[0], ids=_id[1])
-
-                if msg and msg.text != (restarted_text):
-                    await app.edit_message(
-                        _id[0], _id[1], restarted_text, parse_mode="html"
-                    )
+                await app.edit_message(
+                    _id[0], _id[1], restarted_text, parse_mode="html"
+                )
+            except (errors.MessageNotModifiedError, errors.MessageIdInvalidError):
+                pass
             except:  # noqa: E722
                 await self.on_start(bot, self.db, prefix, app)
 
@@ -25,6 +25,34 @@ class TeaConfigMod(loader.Module):
 
     def __init__(self):
         self._bot: Bot = self.inline.bot
+        self._markup_key: typing.Optional[tuple] = None
+        self._markup = None
+
+    def get_config(self, module: loader.Module) -> typing.Any:
+        """Returns module's config or empty string if module has none"""
+        config = getattr(module, "config", None)
+        return config if isinstance(config, loader.ModuleConfig) else ""
+
+    def modules_markup(self):
+        """Returns modules keyboard, rebuilt only when the modules list changes"""
+        key = tuple(self.manager.modules)
+        if key != self._markup_key:
+            self._markup = self.inline._generate_markup(
+                utils.sublist(
+                    [
+                        {
+                            "text": module.name.title(),
+                            "callback": self.configure,
+                            "args": (module.name),
+                        }
+                        for module in self.manager.modules
+                        if self.get_config(module)
+                    ]
+                )
+            )
+            self._markup_key = key
+
+        return self._markup
 
     def keywords(self, config, option: str) -> str:
         validator = getattr(config.config[option], "validator")
@@ -149,23 +177,12 @@ class TeaConfigMod(loader.Module):
         )
 
     async def back_modules(self, call: InlineCall):
-        markup = [
-            {
-                "text": module.name.title(),
-                "callback": self.configure,
-                "args": (module.name),
-            }
-            for module in self.manager.modules
-            if getattr(self.lookup(module.name), "config", "")
-        ]
-
         await call.edit(
-            self.strings("choose_module"),
-            reply_markup=self.inline._generate_markup(utils.sublist(markup)),
+            self.strings("choose_module"), reply_markup=self.modules_markup()
         )
 
     async def show_value(self, call: InlineCall, module: str, option: str, value: str):
-        config = self.lookup(module).config
+        config = self.get_config(self.lookup(module))
         docstring = config.get_doc(option)
         default = config.get_default(option)
         value = config[option]
@@ -211,14 +228,14 @@ class TeaConfigMod(loader.Module):
     async def configure(self, call: InlineCall, module: str):
         markup = [
             {"text": option, "callback": self.configure_value, "args": (module, option)}
-            for option in self.lookup(module).config
+            for option in self.get_config(self.lookup(module))
         ] + [[{"text": self.strings("back"), "callback": self.back_modules}]]
         await call.edit(
             self.strings("choose_value"), self.inline._generate_markup(markup)
         )
 
     async def configure_value(self, call: InlineCall, module: str, option: str):
-        config = self.lookup(module).config
+        config = self.get_config(self.lookup(module))
         docstring = config.get_doc(option)
         default = config.get_default(option)
         validator = getattr(config.config[option], "validator", None)
@@ -273,20 +290,7 @@ class TeaConfigMod(loader.Module):
 
     async def opencfg(self, call: InlineCall):
         await call.edit(
-            text=self.strings("choose_module"),
-            reply_markup=self.inline._generate_markup(
-                utils.sublist(
-                    [
-                        {
-                            "text": module.name.title(),
-                            "callback": self.configure,
-                            "args": (module.name),
-                        }
-                        for module in self.manager.modules
-                        if getattr(self.lookup(module.name), "config", "")
-                    ]
-                )
-            ),
+            text=self.strings("choose_module"), reply_markup=self.modules_markup()
         )
 
     @loader.command()
@@ -46,7 +46,9 @@ async def get_git_raw_link(repo_url: str):
     branch = match.group(2)
     path = match.group(3)
 
-    r = await utils.run_sync(requests.get, f"https://api.github.com/repos{repo_path}")
+    r = await utils.run_sync(
+        utils.get_session().get, f"https://api.github.com/repos{repo_path}"
+    )
     if r.status_code != 200:
         return False
 
@@ -152,9 +154,11 @@ class LoaderMod(loader.Module):
         )
 
     async def get_module_list(self, raw_link):
-        modules = await utils.run_sync(requests.get, f"{raw_link}all.txt")
+        modules = await utils.run_sync(utils.get_session().get, f"{raw_link}all.txt")
         if modules.status_code != 200:
-            modules = await utils.run_sync(requests.get, f"{raw_link}full.txt")
+            modules = await utils.run_sync(
+                utils.get_session().get, f"{raw_link}full.txt"
+            )
             if modules.status_code != 200:
                 return []
 
@@ -165,10 +169,11 @@ class LoaderMod(loader.Module):
         count = 0
 
         if args == "all":
+            loaded = []
             for module in modules:
                 module = raw_link + module + ".py"
                 try:
-                    r = await utils.run_sync(requests.get, module)
+                    r = await utils.run_sync(utils.get_session().get, module)
                     if r.status_code != 200:
                         raise requests.exceptions.RequestException
                 except requests.exceptions.RequestException:
@@ -178,18 +183,21 @@ class LoaderMod(loader.Module):
                 if not module_name:
                     continue
 
+                loaded.append(module)
+                count += 1
+
+            if loaded:
                 self.db.set(
                     "teagram.loader",
                     "modules",
-                    list(set(self.db.get("teagram.loader", "modules", []) + [module])),
+                    list(set(self.db.get("teagram.loader", "modules", []) + loaded)),
                 )
-                count += 1
         else:
             if args in modules:
                 args = raw_link + args + ".py"
 
             try:
-                r = await utils.run_sync(requests.get, args)
+                r = await utils.run_sync(utils.get_session().get, args)
                 if r.status_code != 200:
                     raise requests.exceptions.ConnectionError
 
@@ -221,7 +229,7 @@ class LoaderMod(loader.Module):
             return await utils.answer(message, "❌ Вы не указали ссылку")
 
         try:
-            response = await utils.run_sync(requests.get, args)
+            response = await utils.run_sync(utils.get_session().get, args)
             module = await self.manager.load_module(response.text, response.url)
 
             if isinstance(module, tuple):
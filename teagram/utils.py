@@ -11,6 +11,7 @@
 
 
 import subprocess
+import atexit
 import functools
 import requests
 import logging
@@ -27,13 +28,14 @@ import re
 import io
 
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 
 import contextlib
 from types import FunctionType
 from urllib.parse import urlparse
 from typing import Any, List, Literal, Tuple, Union
-from telethon import TelegramClient, types, events, hints
+from telethon import TelegramClient, errors, types, events, hints
 from telethon.tl.types import MessageEntityUnknown
 from telethon.tl.functions.channels import (
     CreateChannelRequest,
@@ -50,6 +52,11 @@ from telethon.types import (
 from telethon.tl.functions.account import UpdateNotifySettingsRequest
 from telethon.tl import custom
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from . import database, init_time
 from .types import HTMLParser
 
@@ -64,6 +71,20 @@ BASE_DIR = (
 )
 BASE_PATH = Path(BASE_DIR)
 
+_ALPHABET = string.ascii_letters + string.digits
+_LANGPACK_CACHE: typing.Dict[str, dict] = {}
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 2), thread_name_prefix="teagram-sync"
+)
+_SESSION: typing.Optional[requests.Session] = None
+_PROC_STATS_TTL = 0.5
+_ROOT_PROC = None
+_PROC_STATS: typing.Tuple[float, float, float] = (-_PROC_STATS_TTL, 0.0, 0.0)
+_DEFAULT_PREFIXES = ["."]
+_PREFIX_CACHE: typing.Tuple[
+    typing.Optional[list], typing.Tuple[str, ...], typing.Optional[re.Pattern]
+] = (None, (), None)
+
 lsb_release_exists = False
 try:
     subprocess.run(["lsb_release"], capture_output=True, text=False)
@@ -75,6 +96,22 @@ else:
     lsb_release_exists = True
 
 
+def get_session() -> requests.Session:
+    """
+    Get shared HTTP session, so repeated requests reuse connections.
+
+    Returns:
+        requests.Session: Session.
+    """
+    global _SESSION
+
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        atexit.register(_SESSION.close)
+
+    return _SESSION
+
+
 def git_hash():
     return git.Repo().head.commit.hexsha
 
@@ -118,6 +155,29 @@ def get_args_raw(message: Message) -> str:
     return ""
 
 
+def _get_prefixes() -> typing.Tuple[typing.Tuple[str, ...], re.Pattern]:
+    """
+    Get command prefixes and a pattern matching any of them followed by some text.
+    Both are rebuilt only when the stored list changes.
+
+    Returns:
+        Tuple[Tuple[str, ...], re.Pattern]: Prefixes and pattern.
+    """
+    global _PREFIX_CACHE
+
+    prefixes = database.db.get("teagram.loader", "prefixes", _DEFAULT_PREFIXES)
+    if _PREFIX_CACHE[0] is not prefixes:
+        # Alternatives are tried in order, like the prefixes list itself
+        pattern = (
+            re.compile("(?:{})(?=.)".format("|".join(map(re.escape, prefixes))), re.S)
+            if prefixes
+            else re.compile("(?!)")
+        )
+        _PREFIX_CACHE = (prefixes, tuple(prefixes), pattern)
+
+    return _PREFIX_CACHE[1:]
+
+
 def get_full_command(
     message: Message,
 ) -> Union[Tuple[Literal[""], Literal[""], Literal[""]], Tuple[str, str, str]]:
@@ -141,22 +201,15 @@ def get_full_command(
     For the example message_text, result will be: ("/", "command", "arg1 arg2")
     """
 
-    message.text = str(message.text)
-    message.raw_text = str(message.raw_text)
-
-    prefixes = database.db.get("teagram.loader", "prefixes", ["."])
+    text = message.raw_text
+    if not text:
+        return "", "", ""
 
-    for prefix in prefixes:
-        if (
-            message.raw_text
-            and len(message.raw_text) > len(prefix)
-            and message.raw_text.startswith(prefix)
-        ):
-            command, *args = message.raw_text[len(prefix) :].split(maxsplit=1)
-            break
-    else:
+    prefixes, pattern = _get_prefixes()
+    if not text.startswith(prefixes) or not (match := pattern.match(text)):
         return "", "", ""
 
+    command, *args = text[match.end() :].split(maxsplit=1)
     return prefixes[0], command.lower(), args[-1] if args else ""
 
 
@@ -175,7 +228,19 @@ def get_chat(message: Message) -> typing.Optional[int]:
     :param message: Message to get chat of
     :return: int or None if not present
     """
-    return message.chat.id if message.chat else message._chat_peer
+    chat_id = getattr(message, "_teagram_chat_id", None)
+    if chat_id is not None:
+        return chat_id
+
+    if getattr(message, "chat", None):
+        chat_id = message.chat.id
+    else:
+        chat_id = getattr(message, "_chat_peer", None)
+
+    with contextlib.suppress(AttributeError):
+        message._teagram_chat_id = chat_id
+
+    return chat_id
 
 
 def get_chat_id(message: Message) -> typing.Optional[int]:
@@ -582,7 +647,7 @@ async def set_avatar(
     if isinstance(avatar, str) and check_url(avatar):
         f = (
             await run_sync(
-                requests.get,
+                get_session().get,
                 avatar,
             )
         ).content
@@ -721,11 +786,15 @@ async def answer(
                 if message.out:
                     await message.delete()
         else:
-            try:
-                msg = await client.edit_message(
-                    chat, message.id, response, parse_mode=parse_mode, **kwargs
-                )
-            except:  # noqa: E722
+            # Only own messages can be edited; foreign ones and refused edits
+            # (caption too long, edit time expired, flood wait...) get a reply
+            if message.out:
+                with contextlib.suppress(errors.RPCError):
+                    msg = await client.edit_message(
+                        chat, message.id, response, parse_mode=parse_mode, **kwargs
+                    )
+
+            if not msg:
                 msg = await message.reply(
                     response,
                     parse_mode=parse_mode,
@@ -790,11 +859,42 @@ def run_sync(func: FunctionType, *args, **kwargs) -> asyncio.Future:
             print(result)  # Output: 10
     """
 
-    return asyncio.get_event_loop().run_in_executor(
-        None, functools.partial(func, *args, **kwargs)
+    return asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR, functools.partial(func, *args, **kwargs)
     )
 
 
+def _collect_proc_stats() -> typing.Tuple[float, float]:
+    """
+    Get memory (in megabytes) and CPU usage of the process and its children.
+    Children are walked once for both values, the result is reused for a short time.
+
+    Returns:
+        Tuple[float, float]: Memory usage and CPU usage.
+    """
+    global _ROOT_PROC, _PROC_STATS
+
+    now = time.monotonic()
+    if now - _PROC_STATS[0] < _PROC_STATS_TTL:
+        return _PROC_STATS[1:]
+
+    import psutil
+
+    if _ROOT_PROC is None:
+        _ROOT_PROC = psutil.Process(os.getpid())
+
+    mem = _ROOT_PROC.memory_info()[0] / 2.0**20
+    cpu = _ROOT_PROC.cpu_percent()
+
+    for child in _ROOT_PROC.children(recursive=True):
+        with contextlib.suppress(psutil.Error):
+            mem += child.memory_info()[0] / 2.0**20
+            cpu += child.cpu_percent()
+
+    _PROC_STATS = (now, mem, cpu)
+    return mem, cpu
+
+
 def get_ram() -> float:
     """
     Get memory usage in megabytes.
@@ -804,13 +904,7 @@ def get_ram() -> float:
     """
 
     try:
-        import psutil
-
-        process = psutil.Process(os.getpid())
-        mem = process.memory_info()[0] / 2.0**20
-        for child in process.children(recursive=True):
-            mem += child.memory_info()[0] / 2.0**20
-        return round(mem, 1)
+        return round(_collect_proc_stats()[0], 1)
     except:  # noqa: E722
         return 0
 
@@ -824,15 +918,7 @@ def get_cpu() -> float:
     """
 
     try:
-        import psutil
-
-        process = psutil.Process(os.getpid())
-        cpu = process.cpu_percent()
-
-        for child in process.children(recursive=True):
-            cpu += child.cpu_percent()
-
-        return cpu
+        return _collect_proc_stats()[1]
     except:  # noqa: E722
         return 0
 
@@ -844,13 +930,13 @@ def get_display_name(entity: Union[types.User, types.Chat]) -> str:
     Returns:
         entity: Union[types.User, types.Chat].
     """
-    return (
-        getattr(entity, "title", None)
-        or entity.first_name
-        or ("" + (f" {entity.last_name}" if entity.last_name else ""))
-    )
+    if title := getattr(entity, "title", None):
+        return title
+
+    return " ".join(filter(None, (entity.first_name, entity.last_name)))
 
 
+@functools.lru_cache(maxsize=1)
 def get_platform() -> str:
     """
     Get the platform information.
@@ -896,9 +982,7 @@ def random_id(length: int = 10) -> str:
         str: Random ID.
     """
 
-    return "".join(
-        random.choice(string.ascii_letters + string.digits) for _ in range(length)
-    )
+    return "".join(random.choices(_ALPHABET, k=length))
 
 
 def get_langpack() -> Any:
@@ -914,10 +998,11 @@ def get_langpack() -> Any:
 
         get_langpack()
     else:
-        with open(f"teagram/langpacks/{lang}.yml", encoding="utf-8") as file:
-            pack = yaml.safe_load(file)
+        if lang not in _LANGPACK_CACHE:
+            with open(f"teagram/langpacks/{lang}.yml", encoding="utf-8") as file:
+                _LANGPACK_CACHE[lang] = yaml.load(file, Loader=YamlLoader)
 
-        return pack
+        return _LANGPACK_CACHE[lang]
 
 
 def get_distro() -> str: